@@ -1,6 +1,8 @@
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from math import hypot
-from typing import Dict, Tuple
+from typing import Tuple
 
 import microscopemetrics_schema.datamodel as mm_schema
 import numpy as np
@@ -8,7 +10,6 @@ import pandas as pd
 import scipy
 from skimage.exposure import rescale_intensity
 from skimage.filters import gaussian
-from skimage.measure import regionprops
 
 from microscopemetrics import SaturationError
 from microscopemetrics.analyses import (
@@ -18,7 +19,12 @@ from microscopemetrics.analyses import (
     numpy_to_mm_image,
     validate_requirements,
 )
-from microscopemetrics.analyses.tools import fit_gaussian, is_saturated
+from microscopemetrics.analyses.tools import fit_gaussian, get_saturated_channels
+
+LINE_PROFILE_SIZE = 255
+LINE_PROFILE_STROKE_COLOR = {"r": 0, "g": 0, "b": 255, "alpha": 200}
+CORNER_STROKE_COLOR = {"r": 0, "g": 255, "b": 0, "alpha": 200}
+CENTER_COLOR = {"r": 255, "g": 0, "b": 0, "alpha": 200}
 
 
 def _get_center_region_mask(channel: np.ndarray, fraction: float = 0.1) -> np.ndarray:
@@ -38,35 +44,46 @@ def _get_center_region_mask(channel: np.ndarray, fraction: float = 0.1) -> np.nd
     return mask
 
 
-def _channel_line_profile(
-    channel: np.ndarray, start: Tuple[int, int], end: Tuple[int, int], profile_size: int
-) -> np.ndarray:
+def _channel_line_profile(channel: np.ndarray, coordinates: np.ndarray) -> np.ndarray:
     """
-    Compute the intensity profile along a line between x0-y0 and x1-y1 using cubic interpolation. The mode used is
-    'nearest' to avoid edge artifacts.
+    Compute the intensity profiles along a set of lines using cubic interpolation. The mode used is 'nearest' to avoid
+    edge artifacts. All the lines are sampled in a single call so that the spline prefilter of the channel is only
+    computed once.
     Parameters
     ----------
     channel : np.array.
         image on a 2d np.ndarray format.
-    start : (int, int)
-        coordinates of the starting pixel
-    end : (int, int)
-        coordinates of the ending pixel
+    coordinates : np.ndarray
+        3d np.ndarray of shape (2, nr_lines, profile_size) holding the coordinates sampled along each line.
     Returns
     -------
     line_pixel_values : np.ndarray
-        1d np.ndarray representing the values of the chosen line of pixels.
+        2d np.ndarray representing the values of the chosen lines of pixels. One row per line.
     """
-    x, y = np.linspace(start[0], end[0], profile_size), np.linspace(start[1], end[1], profile_size)
-
     return scipy.ndimage.map_coordinates(
         input=channel,
-        coordinates=np.vstack((x, y)),
+        coordinates=coordinates,
         mode="nearest",
     )
 
 
-def _image_line_profile(image: np.ndarray, profile_size: int):
+@lru_cache(maxsize=16)
+def _line_profile_coordinates(
+    y_size: int, x_size: int
+) -> Tuple[Tuple[str, Tuple[Tuple[int, int], Tuple[int, int]]], ...]:
+    """
+    Compute the start and end (x, y) coordinates of the intensity profile lines of an image as (name, coordinates)
+    pairs. Images of a dataset usually share the same shape, so the results are cached.
+    """
+    return (
+        ("leftTop_to_rightBottom", ((0, 0), (x_size, y_size))),
+        ("leftBottom_to_rightTop", ((0, y_size), (x_size, 0))),
+        ("center_horizontal", ((0, y_size // 2), (x_size, y_size // 2))),
+        ("center_vertical", ((x_size // 2, 0), (x_size // 2, y_size))),
+    )
+
+
+def _image_line_profile(image: np.ndarray, profile_size: int = LINE_PROFILE_SIZE):
     """
     Compute the intensity profile along a line between x0-y0 and x1-y1
     Parameters
@@ -80,67 +97,34 @@ def _image_line_profile(image: np.ndarray, profile_size: int):
     line_pixel_values : np.ndarray
         2d np.ndarray representing the values of the chosen line of pixels for each channel.
     """
-    profile_coordinates = {
-        "leftTop_to_rightBottom": ((0, 0), (image.shape[-2], image.shape[-3])),
-        "leftBottom_to_rightTop": ((0, image.shape[-3]), (image.shape[-2], 0)),
-        "center_horizontal": (
-            (0, image.shape[-3] // 2),
-            (image.shape[-2], image.shape[-3] // 2),
-        ),
-        "center_vertical": (
-            (image.shape[-2] // 2, 0),
-            (image.shape[-2] // 2, image.shape[-3]),
-        ),
+    profile_coordinates = _line_profile_coordinates(image.shape[-3], image.shape[-2])
+    # The sampling coordinates are shared by all the channels so we build them only once
+    coordinates = np.stack(
+        [np.linspace(start, end, profile_size, axis=-1) for _, (start, end) in profile_coordinates],
+        axis=1,
+    )
+    # A single buffer is filled in place with the profiles of all the channels
+    profiles = np.empty((image.shape[-1], len(profile_coordinates), profile_size), dtype=np.float32)
+    for c in range(image.shape[-1]):
+        profiles[c] = _channel_line_profile(image[0, 0, :, :, c], coordinates)
+
+    output = {
+        f"ch{c:02}_{profile_name}": profiles[c, p].tolist()
+        for p, (profile_name, _) in enumerate(profile_coordinates)
+        for c in range(image.shape[-1])
     }
-    output = {}
-    for profile_name, (start, end) in profile_coordinates.items():
-        profiles = np.zeros((image.shape[-1], 255))
-        for c in range(image.shape[-1]):
-            profiles[c, :] = _channel_line_profile(
-                np.squeeze(image[0, 0, :, :, c]), start, end, profile_size
-            )
-        output = output | {
-            f"ch{c:02}_{profile_name}": profiles[c].tolist() for c in range(image.shape[-1])
-        }
 
     return output
 
 
 def _line_profile_shapes(image: np.ndarray):
-    stroke_color = {"r": 0, "g": 0, "b": 255, "alpha": 200}
     return [
         mm_schema.Line(
-            name="leftTop_to_rightBottom",
-            x1=0,
-            y1=0,
-            x2=image.shape[-2],
-            y2=image.shape[-3],
-            stroke_color=stroke_color,
-        ),
-        mm_schema.Line(
-            name="leftBottom_to_rightTop",
-            x1=0,
-            y1=image.shape[-3],
-            x2=image.shape[-2],
-            y2=0,
-            stroke_color=stroke_color,
-        ),
-        mm_schema.Line(
-            name="center_horizontal",
-            x1=0,
-            y1=image.shape[-3] // 2,
-            x2=image.shape[-2],
-            y2=image.shape[-3] // 2,
-            stroke_color=stroke_color,
-        ),
-        mm_schema.Line(
-            name="center_vertical",
-            x1=image.shape[-2] // 2,
-            y1=0,
-            x2=image.shape[-2] // 2,
-            y2=image.shape[-3],
-            stroke_color=stroke_color,
-        ),
+            name=name, x1=x1, y1=y1, x2=x2, y2=y2, stroke_color=LINE_PROFILE_STROKE_COLOR
+        )
+        for name, ((x1, y1), (x2, y2)) in _line_profile_coordinates(
+            image.shape[-3], image.shape[-2]
+        )
     ]
 
 
@@ -148,40 +132,42 @@ def _c_shape(name, x, y, size, s_col):
     return mm_schema.Rectangle(name=name, x=x, y=y, w=size, h=size, stroke_color=s_col)
 
 
+@lru_cache(maxsize=16)
+def _corner_coordinates(
+    y_size: int, x_size: int, corner_fraction: float
+) -> Tuple[int, int, int, Tuple[Tuple[str, Tuple[int, int]], ...]]:
+    """
+    Compute the corner fraction in pixels (cfp), the center range (cr) and the top left (x, y) coordinates of the
+    corner regions of an image as (name, coordinates) pairs. Images of a dataset usually share the same shape, so
+    the results are cached.
+    """
+    cfp = int(corner_fraction * (y_size + x_size) / 2)
+    cr_y = int((y_size - cfp) / 2)
+    cr_x = int((x_size - cfp) / 2)
+
+    return (
+        cfp,
+        cr_y,
+        cr_x,
+        (
+            ("top_left", (0, 0)),
+            ("top_center", (cr_x, 0)),
+            ("top_right", (x_size - cfp, 0)),
+            ("middle_left", (0, cr_y)),
+            ("middle_center", (cr_x, cr_y)),
+            ("middle_right", (x_size - cfp, cr_y)),
+            ("bottom_left", (0, y_size - cfp)),
+            ("bottom_center", (cr_x, y_size - cfp)),
+            ("bottom_right", (x_size - cfp, y_size - cfp)),
+        ),
+    )
+
+
 def _corner_shapes(image: np.ndarray, corner_fraction: float):
-    cfp = int(corner_fraction * (image.shape[-3] + image.shape[-2]) / 2)
-    cr_y = int((image.shape[-3] - cfp) / 2)
-    cr_x = int((image.shape[-2] - cfp) / 2)
-    stroke_color = {"r": 0, "g": 255, "b": 0, "alpha": 200}
+    cfp, _, _, corners = _corner_coordinates(image.shape[-3], image.shape[-2], corner_fraction)
 
     return [
-        _c_shape("top_left", x=0, y=0, size=cfp, s_col=stroke_color),
-        _c_shape("top_center", x=cr_x, y=0, size=cfp, s_col=stroke_color),
-        _c_shape("top_right", x=image.shape[-2] - cfp, y=0, size=cfp, s_col=stroke_color),
-        _c_shape("middle_left", x=0, y=cr_y, size=cfp, s_col=stroke_color),
-        _c_shape("middle_center", x=cr_x, y=cr_y, size=cfp, s_col=stroke_color),
-        _c_shape(
-            "middle_right",
-            x=image.shape[-2] - cfp,
-            y=cr_y,
-            size=cfp,
-            s_col=stroke_color,
-        ),
-        _c_shape("bottom_left", x=0, y=image.shape[-3] - cfp, size=cfp, s_col=stroke_color),
-        _c_shape(
-            "bottom_center",
-            x=cr_x,
-            y=image.shape[-3] - cfp,
-            size=cfp,
-            s_col=stroke_color,
-        ),
-        _c_shape(
-            "bottom_right",
-            y=image.shape[-3] - cfp,
-            x=image.shape[-2] - cfp,
-            size=cfp,
-            s_col=stroke_color,
-        ),
+        _c_shape(name, x=x, y=y, size=cfp, s_col=CORNER_STROKE_COLOR) for name, (x, y) in corners
     ]
 
 
@@ -193,53 +179,68 @@ def _channel_max_intensity_properties(
     Compute the maximum intensity properties of a channel
     """
     if sigma is not None:
-        proc_channel = gaussian(image=channel, sigma=sigma, preserve_range=True, channel_axis=None)
+        # Single precision is enough for the intensity statistics and halves the memory traffic
+        proc_channel = gaussian(
+            image=channel.astype(np.float32, copy=False),
+            sigma=sigma,
+            preserve_range=True,
+            channel_axis=None,
+        )
     else:
         proc_channel = channel
 
+    # The maximum intensity region is made of the pixels at the maximum intensity value and the center region of the
+    # pixels falling in the highest non-empty intensity bin below it.
+    max_intensity = proc_channel.max()
+    max_intensity_mask = proc_channel == max_intensity
+    next_intensity = proc_channel[~max_intensity_mask].max()
+
     # When images are very flat, the max intensity region is always detected in the center. We need to stretch the
     # intensity of the image to detect the actual center. We loop over a list of number of bins to get a central region
     # that is not too big. We consider 0.25 as the maximum fraction of the image that can be considered as the center.
     center_region_area_fraction = 1
     center_region_intensity_fraction = None
-    properties = None
+    center_region_mask = None
     for n_bins in [11, 21, 51, 101, 201, 501]:
         if center_region_area_fraction < 0.2:
             break
-        rescaled_channel = rescale_intensity(
-            # We scale in 1 value more than the bins we want to achieve.
-            # Like that the top value is not included in the last bin.
-            proc_channel.astype(float),
-            in_range=(0, proc_channel.max()),
-            out_range=(0, n_bins),
+        # We threshold directly at the lower edge of the bin holding the next intensity below the maximum
+        bin_lower_edge = np.floor(next_intensity / max_intensity * n_bins) * max_intensity / n_bins
+        center_region_mask = (proc_channel >= bin_lower_edge) & ~max_intensity_mask
+        center_region_area_fraction = np.count_nonzero(center_region_mask) / (
+            channel.shape[0] * channel.shape[1]
         )
-        labels_channel = rescaled_channel.astype(int)
-        properties = regionprops(labels_channel, proc_channel)
-        center_region_area_fraction = properties[-2].area / (channel.shape[0] * channel.shape[1])
         center_region_intensity_fraction = 1 / (n_bins - 1)
 
+    # The properties are converted once to native floats so that they are not re-boxed downstream
+    center_region_y, center_region_x = (float(np.mean(c)) for c in np.nonzero(center_region_mask))
+    max_intensity_pos_y, max_intensity_pos_x = (
+        float(np.mean(c)) for c in np.nonzero(max_intensity_mask)
+    )
+
     # Fitting the intensity profile to a gaussian
     _, _, _, (_, _, center_fitted_y, _) = fit_gaussian(np.max(channel, axis=1))
     _, _, _, (_, _, center_fitted_x, _) = fit_gaussian(np.max(channel, axis=0))
+    center_fitted_y, center_fitted_x = float(center_fitted_y), float(center_fitted_x)
 
     return {
         "center_region_intensity_fraction": center_region_intensity_fraction,
-        "center_region_area_fraction": center_region_area_fraction,
-        "center_of_mass_y": properties[-2].centroid[0],
-        "center_of_mass_y_relative": properties[-2].centroid[0] / (channel.shape[0] / 2) - 1,
-        "center_of_mass_x": properties[-2].centroid[1],
-        "center_of_mass_x_relative": properties[-2].centroid[1] / (channel.shape[1] / 2) - 1,
+        "center_region_area_fraction": float(center_region_area_fraction),
+        "center_of_mass_y": center_region_y,
+        "center_of_mass_y_relative": center_region_y / (channel.shape[0] / 2) - 1,
+        "center_of_mass_x": center_region_x,
+        "center_of_mass_x_relative": center_region_x / (channel.shape[1] / 2) - 1,
         "center_of_mass_distance_relative": hypot(
-            properties[-2].centroid[0] / (channel.shape[0] / 2) - 1,
-            properties[-2].centroid[1] / (channel.shape[1] / 2) - 1,
+            center_region_y / (channel.shape[0] / 2) - 1,
+            center_region_x / (channel.shape[1] / 2) - 1,
         ),
-        "center_geometric_y": properties[-2].centroid[0],
-        "center_geometric_y_relative": properties[-2].centroid[0] / (channel.shape[0] / 2) - 1,
-        "center_geometric_x": properties[-2].centroid[1],
-        "center_geometric_x_relative": properties[-2].centroid[1] / (channel.shape[1] / 2) - 1,
+        "center_geometric_y": center_region_y,
+        "center_geometric_y_relative": center_region_y / (channel.shape[0] / 2) - 1,
+        "center_geometric_x": center_region_x,
+        "center_geometric_x_relative": center_region_x / (channel.shape[1] / 2) - 1,
         "center_geometric_distance_relative": hypot(
-            properties[-2].centroid[0] / (channel.shape[0] / 2) - 1,
-            properties[-2].centroid[1] / (channel.shape[1] / 2) - 1,
+            center_region_y / (channel.shape[0] / 2) - 1,
+            center_region_x / (channel.shape[1] / 2) - 1,
         ),
         "center_fitted_y": center_fitted_y,
         "center_fitted_y_relative": center_fitted_y / (channel.shape[0] / 2) - 1,
@@ -249,14 +250,14 @@ def _channel_max_intensity_properties(
             center_fitted_y / (channel.shape[0] / 2) - 1,
             center_fitted_x / (channel.shape[1] / 2) - 1,
         ),
-        "max_intensity": properties[-2].intensity_max,
-        "max_intensity_pos_y": properties[-1].centroid[0],
-        "max_intensity_pos_y_relative": properties[-1].centroid[0] / (channel.shape[0] / 2) - 1,
-        "max_intensity_pos_x": properties[-1].centroid[1],
-        "max_intensity_pos_x_relative": properties[-1].centroid[1] / (channel.shape[1] / 2) - 1,
+        "max_intensity": float(next_intensity),
+        "max_intensity_pos_y": max_intensity_pos_y,
+        "max_intensity_pos_y_relative": max_intensity_pos_y / (channel.shape[0] / 2) - 1,
+        "max_intensity_pos_x": max_intensity_pos_x,
+        "max_intensity_pos_x_relative": max_intensity_pos_x / (channel.shape[1] / 2) - 1,
         "max_intensity_distance_relative": hypot(
-            properties[-1].centroid[0] / (channel.shape[0] / 2) - 1,
-            properties[-1].centroid[1] / (channel.shape[1] / 2) - 1,
+            max_intensity_pos_y / (channel.shape[0] / 2) - 1,
+            max_intensity_pos_x / (channel.shape[1] / 2) - 1,
         ),
     }
 
@@ -264,33 +265,37 @@ def _channel_max_intensity_properties(
 def _channel_corner_properties(channel: np.ndarray, corner_fraction: float) -> dict:
     max_intensity = np.max(channel)
 
-    # Calculate the corner fraction in pixels (cfp) of the image size
+    # Get the corner fraction in pixels (cfp) of the image size
     # to use as the corner size and the center range (cr)
-    cfp = int(corner_fraction * (channel.shape[0] + channel.shape[1]) / 2)
-    cr_y = int((channel.shape[0] - cfp) / 2)
-    cr_x = int((channel.shape[1] - cfp) / 2)
-
-    return {
-        "top_left_intensity_mean": np.mean(channel[0:cfp, 0:cfp]),
-        "top_left_intensity_ratio": np.mean(channel[0:cfp, 0:cfp]) / max_intensity,
-        "top_center_intensity_mean": np.mean(channel[0:cfp, cr_x:-cr_x]),
-        "top_center_intensity_ratio": np.mean(channel[0:cfp, cr_x:-cr_x]) / max_intensity,
-        "top_right_intensity_mean": np.mean(channel[0:cfp, -cfp:-1]),
-        "top_right_intensity_ratio": np.mean(channel[0:cfp, -cfp:-1]) / max_intensity,
-        "middle_left_intensity_mean": np.mean(channel[cr_y:-cr_y, 0:cfp]),
-        "middle_left_intensity_ratio": np.mean(channel[cr_y:-cr_y, 0:cfp]) / max_intensity,
-        "middle_center_intensity_mean": np.mean(channel[cr_y:-cr_y, cr_x:-cr_x]),
-        "middle_center_intensity_ratio": np.mean(channel[cr_y:-cr_y, cr_x:-cr_x]) / max_intensity,
-        "middle_right_intensity_mean": np.mean(channel[cr_y:-cr_y, -cfp:-1]),
-        "middle_right_intensity_ratio": np.mean(channel[cr_y:-cr_y, -cfp:-1]) / max_intensity,
-        "bottom_left_intensity_mean": np.mean(channel[-cfp:-1, 0:cfp]),
-        "bottom_left_intensity_ratio": np.mean(channel[-cfp:-1, 0:cfp]) / max_intensity,
-        "bottom_center_intensity_mean": np.mean(channel[-cfp:-1, cr_x:-cr_x]),
-        "bottom_center_intensity_ratio": np.mean(channel[-cfp:-1, cr_x:-cr_x]) / max_intensity,
-        "bottom_right_intensity_mean": np.mean(channel[-cfp:-1, -cfp:-1]),
-        "bottom_right_intensity_ratio": np.mean(channel[-cfp:-1, -cfp:-1]) / max_intensity,
+    cfp, cr_y, cr_x, _ = _corner_coordinates(channel.shape[0], channel.shape[1], corner_fraction)
+
+    regions = {
+        "top_left": (slice(0, cfp), slice(0, cfp)),
+        "top_center": (slice(0, cfp), slice(cr_x, -cr_x)),
+        "top_right": (slice(0, cfp), slice(-cfp, -1)),
+        "middle_left": (slice(cr_y, -cr_y), slice(0, cfp)),
+        "middle_center": (slice(cr_y, -cr_y), slice(cr_x, -cr_x)),
+        "middle_right": (slice(cr_y, -cr_y), slice(-cfp, -1)),
+        "bottom_left": (slice(-cfp, -1), slice(0, cfp)),
+        "bottom_center": (slice(-cfp, -1), slice(cr_x, -cr_x)),
+        "bottom_right": (slice(-cfp, -1), slice(-cfp, -1)),
     }
 
+    # Every region is reduced only once and its mean reused for the ratio
+    properties = {}
+    for region_name, region in regions.items():
+        intensity_mean = float(np.mean(channel[region]))
+        properties[f"{region_name}_intensity_mean"] = intensity_mean
+        properties[f"{region_name}_intensity_ratio"] = intensity_mean / max_intensity
+
+    return properties
+
+
+def _channel_properties(channel: np.ndarray, corner_fraction: float, sigma: float) -> dict:
+    return _channel_max_intensity_properties(channel, sigma) | _channel_corner_properties(
+        channel, corner_fraction
+    )
+
 
 def _image_properties(images: list[mm_schema.Image], corner_fraction: float, sigma: float):
     """
@@ -307,38 +312,22 @@ def _image_properties(images: list[mm_schema.Image], corner_fraction: float, sig
         their ratio over the maximum intensity value of the array.
         Dictionary values will be lists in case of multiple channels.
     """
-    properties = pd.DataFrame()
+    properties = defaultdict(list)
     for image in images:
-        # For the analysis we are using only the first z and time-point
-        image_data = image.array_data[0, 0, :, :, :]
-
-        im_properties = pd.DataFrame()
-        for c in range(image_data.shape[-1]):
-            ch_properties = pd.DataFrame(
-                columns=["image_name", "image_id", "channel_name", "channel_nr", "channel_id"]
-            )
-            ch_properties.loc[0] = [
-                image.name,
-                get_object_id(image),
-                image.channel_series.channels[c].name,
-                c,
-                get_object_id(image.channel_series.channels[c]),
-            ]
-            ch_properties = ch_properties.join(
-                pd.DataFrame(
-                    _channel_max_intensity_properties(image_data[:, :, c], sigma), index=[0]
-                )
-            )
-            ch_properties = ch_properties.join(
-                pd.DataFrame(
-                    _channel_corner_properties(image_data[:, :, c], corner_fraction), index=[0]
-                )
-            )
-            im_properties = pd.concat([im_properties, ch_properties], axis=0)
+        # For the analysis we are using only the first z and time-point. Channels are moved to the first axis
+        # in a single copy so that every channel is a contiguous 2d array
+        image_data = np.ascontiguousarray(np.moveaxis(image.array_data[0, 0, :, :, :], -1, 0))
 
-        properties = pd.concat([properties, im_properties], axis=0)
+        for c, channel in enumerate(image_data):
+            properties["image_name"].append(image.name)
+            properties["image_id"].append(get_object_id(image))
+            properties["channel_name"].append(image.channel_series.channels[c].name)
+            properties["channel_nr"].append(c)
+            properties["channel_id"].append(get_object_id(image.channel_series.channels[c]))
+            for key, value in _channel_properties(channel, corner_fraction, sigma).items():
+                properties[key].append(value)
 
-    return properties
+    return pd.DataFrame(properties)
 
 
 def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> bool:
@@ -371,15 +360,13 @@ def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> b
 
         # Check image saturation
         logger.info("Checking image saturation...")
-        saturated_channels = []
-        for c in range(image.array_data.shape[-1]):
-            if is_saturated(
-                channel=image.array_data[..., c],
-                threshold=dataset.input_parameters.saturation_threshold,
-                detector_bit_depth=dataset.input_parameters.bit_depth,
-            ):
-                logger.error(f"Channel {c} is saturated")
-                saturated_channels.append(c)
+        saturated_channels = get_saturated_channels(
+            image=image.array_data,
+            threshold=dataset.input_parameters.saturation_threshold,
+            detector_bit_depth=dataset.input_parameters.bit_depth,
+        )
+        for c in saturated_channels:
+            logger.error(f"Channel {c} is saturated")
         if len(saturated_channels):
             logger.error(f"Channels {saturated_channels} are saturated")
             raise SaturationError(f"Channels {saturated_channels} are saturated")
@@ -399,7 +386,7 @@ def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> b
 
     intensity_profiles = [
         dict_to_table(
-            dictionary=_image_line_profile(image.array_data, profile_size=255),
+            dictionary=_image_line_profile(image.array_data, profile_size=LINE_PROFILE_SIZE),
             name=f"{image.name}_intensity_profiles",
             description=f"Intensity profiles of {image.name}",
         )
@@ -441,8 +428,8 @@ def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> b
                         key_measurements.channel_name.index(image.channel_series.channels[c].name)
                     ],
                     c=c,
-                    stroke_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
-                    fill_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
+                    stroke_color=CENTER_COLOR,
+                    fill_color=CENTER_COLOR,
                     stroke_width=5,
                 )
                 for c in range(image.array_data.shape[-1])
@@ -466,8 +453,8 @@ def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> b
                         key_measurements.channel_name.index(image.channel_series.channels[c].name)
                     ],
                     c=c,
-                    stroke_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
-                    fill_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
+                    stroke_color=CENTER_COLOR,
+                    fill_color=CENTER_COLOR,
                     stroke_width=5,
                 )
                 for c in range(image.array_data.shape[-1])
@@ -491,8 +478,8 @@ def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> b
                         key_measurements.channel_name.index(image.channel_series.channels[c].name)
                     ],
                     c=c,
-                    stroke_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
-                    fill_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
+                    stroke_color=CENTER_COLOR,
+                    fill_color=CENTER_COLOR,
                     stroke_width=5,
                 )
                 for c in range(image.array_data.shape[-1])
@@ -516,8 +503,8 @@ def analyse_field_illumination(dataset: mm_schema.FieldIlluminationDataset) -> b
                         key_measurements.channel_name.index(image.channel_series.channels[c].name)
                     ],
                     c=c,
-                    stroke_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
-                    fill_color={"r": 255, "g": 0, "b": 0, "alpha": 200},
+                    stroke_color=CENTER_COLOR,
+                    fill_color=CENTER_COLOR,
                     stroke_width=5,
                 )
                 for c in range(image.array_data.shape[-1])
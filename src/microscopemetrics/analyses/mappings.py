@@ -10,7 +10,8 @@ from microscopemetrics.analyses import field_illumination, psf_beads
 
 Mapping = namedtuple("Mapping", ["sample_class", "analysis_function", "dataset_class"])
 
-MAPPINGS = [
+# The mappings are only read after import, so they are frozen in a tuple
+MAPPINGS = (
     Mapping(
         mm_schema.FluorescentHomogeneousThinField,
         field_illumination.analyse_field_illumination,
@@ -22,7 +23,7 @@ MAPPINGS = [
         mm_schema.FieldIlluminationDataset,
     ),
     Mapping(mm_schema.PSFBeads, psf_beads.analyse_psf_beads, mm_schema.PSFBeadsDataset),
-]
+)
 
 # TEST = {
 #     mm_schema.FieldIlluminationDataset: {
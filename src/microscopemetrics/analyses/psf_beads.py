@@ -1,9 +1,11 @@
 from datetime import datetime
+from functools import lru_cache
 
 import microscopemetrics_schema.datamodel as mm_schema
 import numpy as np
 import pandas as pd
-from scipy import ndimage, signal
+from scipy import fft, ndimage, signal
+from scipy.spatial import cKDTree
 from skimage.feature import peak_local_max
 from skimage.filters import gaussian
 
@@ -15,7 +17,11 @@ from microscopemetrics.analyses import (
     numpy_to_mm_image,
     validate_requirements,
 )
-from microscopemetrics.analyses.tools import fit_airy, fit_gaussian, is_saturated
+from microscopemetrics.analyses.tools import (
+    fit_airy,
+    fit_gaussian,
+    get_saturated_channels,
+)
 
 
 def _add_column_name_level(df: pd.DataFrame, level_name: str, level_value: str):
@@ -58,53 +64,79 @@ def _average_beads(group: pd.DataFrame) -> np.ndarray:
     """
     Averages the beads in the list by first aligning them to the center of the image and then averaging them.
     """
-    dtype = {bead.dtype for bead in group.beads}
-    if len(dtype) > 1:
+    dtypes = {bead.dtype for bead in group.beads}
+    if len(dtypes) > 1:
         raise ValueError("All beads must have the same dtype.")
-    aligned_beads = [
-        ndimage.shift(row.beads, _find_bead_shifts(row.beads), mode="nearest", order=1)
-        for row in group.itertuples()
-        if row.considered_valid
-    ]
-    if not aligned_beads:
+    valid_beads = [row.beads for row in group.itertuples() if row.considered_valid]
+    if not valid_beads:
         logger.warning("No valid beads to average.")
         return pd.Series({"average_bead": np.nan})
-    if len(aligned_beads) < 2:
+    if len(valid_beads) < 2:
         logger.warning("Less than 2 beads to average.")
-    logger.info(f"Averaging {len(aligned_beads)} beads")
+    logger.info(f"Averaging {len(valid_beads)} beads")
+
+    # The aligned beads are summed up in a running accumulator through a single reused buffer
+    dtype = dtypes.pop()
+    aligned_bead = np.empty(valid_beads[0].shape, dtype=dtype)
+    average_bead = np.zeros(valid_beads[0].shape, dtype=np.float64)
+    for bead in valid_beads:
+        ndimage.shift(bead, _find_bead_shifts(bead), output=aligned_bead, mode="nearest", order=1)
+        average_bead += aligned_bead
+    average_bead /= len(valid_beads)
 
     return pd.Series(
         {
-            "average_bead": np.mean(aligned_beads, axis=0).astype(dtype.pop()),
+            "average_bead": average_bead.astype(dtype),
         }
     )
 
 
+@lru_cache(maxsize=8)
+def _gaussian_reference_fft(shape: tuple[int, ...]) -> tuple[np.ndarray, tuple[int, ...]]:
+    """Returns the real FFT of the reversed Gaussian reference used to find the shifts of beads of a given shape,
+    together with the padded shape it was computed on. Beads of a channel share the same shape, so the reference is
+    only computed once. The returned array must not be modified."""
+    reference = np.zeros(shape)
+    slices = []
+    for dim in shape:
+        if dim % 2 == 0:
+            slices.append(slice(dim // 2))
+        else:
+            slices.append(slice(dim // 2, dim // 2 + 1))
+    reference[tuple(slices)] = 1
+    reference = gaussian(reference, sigma=1, preserve_range=True)
+
+    # Padding to the full correlation size avoids the wrap around of a circular correlation
+    fft_shape = tuple(fft.next_fast_len(2 * dim - 1, real=True) for dim in shape)
+    reference_fft = fft.rfftn(reference[(slice(None, None, -1),) * len(shape)], fft_shape)
+    reference_fft.setflags(write=False)
+
+    return reference_fft, fft_shape
+
+
 def _find_bead_shifts(data1, data2=None):
     """Cross-correlates two 2D or 3D arrays and returns the shifts.
     If a second array is not provided, a Gaussian is used as a reference."""
     if data2 is None:
-        data2 = np.zeros_like(data1)
-        slices = []
-        for dim in data2.shape:
-            if dim % 2 == 0:
-                slices.append(slice(dim // 2))
-            else:
-                slices.append(slice(dim // 2, dim // 2 + 1))
-        data2[tuple(slices)] = 1
-        data2 = gaussian(data2, sigma=1, preserve_range=True)
-
-    if data1.ndim != data2.ndim:
-        raise ValueError("Data1 and Data2 must have the same number of dimensions.")
+        reference_fft, fft_shape = _gaussian_reference_fft(data1.shape)
+        corr_arr = fft.irfftn(fft.rfftn(data1, fft_shape) * reference_fft, fft_shape)
+        # Crop the center of the full correlation, as signal.correlate does with mode="same"
+        corr_arr = corr_arr[
+            tuple(slice((dim - 1) // 2, (dim - 1) // 2 + dim) for dim in data1.shape)
+        ]
+    else:
+        if data1.ndim != data2.ndim:
+            raise ValueError("Data1 and Data2 must have the same number of dimensions.")
 
-    corr_arr = signal.correlate(data1, data2, mode="same")
+        corr_arr = signal.correlate(data1, data2, mode="same")
 
     profiles = []
     max_pos = np.unravel_index(np.argmax(corr_arr), corr_arr.shape)
     for dim in range(corr_arr.ndim):
-        pos_slices = [slice(pos, pos + 1) for pos in max_pos]
+        # Indexing with the integer positions already returns a 1d view along dim
+        pos_slices = list(max_pos)
         pos_slices[dim] = slice(None)
-        profiles.append(np.squeeze(corr_arr[tuple(pos_slices)]))
+        profiles.append(corr_arr[tuple(pos_slices)])
 
     return tuple(fit_gaussian(profile)[3][2] - profile.shape[0] // 2 for profile in profiles)
 
@@ -112,48 +144,30 @@ def _find_bead_shifts(data1, data2=None):
 def _calculate_bead_intensity_outliers(
     bead_positions: pd.DataFrame, robust_z_score_threshold: float
 ) -> None:
-    bead_positions["max_intensity_robust_z_score"] = pd.Series(dtype="float")
-    bead_positions["integrated_intensity_robust_z_score"] = pd.Series(dtype="float")
-    bead_positions["considered_intensity_outlier"] = pd.Series(dtype="bool")
+    # The valid beads intensities are selected only once and both intensities are processed together
+    valid_intensities = bead_positions.loc[
+        bead_positions.considered_valid, ["intensity_max", "intensity_integrated"]
+    ]
 
-    if len(bead_positions[bead_positions.considered_valid]) == 1:
+    if len(valid_intensities) == 1:
         bead_positions["max_intensity_robust_z_score"] = 0
         bead_positions["integrated_intensity_robust_z_score"] = 0
         bead_positions["considered_intensity_outlier"] = False
     else:
-        max_int_mean = bead_positions[bead_positions.considered_valid]["intensity_max"].mean()
-        max_int_median = bead_positions[bead_positions.considered_valid]["intensity_max"].median()
-        max_int_mad = (
-            (bead_positions[bead_positions.considered_valid]["intensity_max"] - max_int_mean)
-            .abs()
-            .mean()
+        intensities_median = valid_intensities.median()
+        intensities_mad = (valid_intensities - valid_intensities.mean()).abs().mean()
+        robust_z_scores = (
+            0.6745
+            * (bead_positions[["intensity_max", "intensity_integrated"]] - intensities_median)
+            / intensities_mad
         )
 
-        integrated_int_mean = bead_positions[bead_positions.considered_valid][
+        bead_positions["max_intensity_robust_z_score"] = robust_z_scores["intensity_max"]
+        bead_positions["integrated_intensity_robust_z_score"] = robust_z_scores[
             "intensity_integrated"
-        ].mean()
-        integrated_int_median = bead_positions[bead_positions.considered_valid][
-            "intensity_integrated"
-        ].median()
-        integrated_int_mad = (
-            (
-                bead_positions[bead_positions.considered_valid]["intensity_integrated"]
-                - integrated_int_mean
-            )
-            .abs()
-            .mean()
-        )
-
-        bead_positions["max_intensity_robust_z_score"] = (
-            0.6745 * (bead_positions["intensity_max"] - max_int_median) / max_int_mad
-        )
-        bead_positions["integrated_intensity_robust_z_score"] = (
-            0.6745
-            * (bead_positions["intensity_integrated"] - integrated_int_median)
-            / integrated_int_mad
-        )
+        ]
 
-        if 1 < len(bead_positions[bead_positions.considered_valid]) < 6:
+        if 1 < len(valid_intensities) < 6:
             bead_positions["considered_intensity_outlier"] = False
         else:
             bead_positions["considered_intensity_outlier"] = (
@@ -233,6 +247,17 @@ def _generate_key_measurements(bead_properties, average_bead_properties):
     return key_measurements
 
 
+def _normalize_profile(profile: np.ndarray) -> np.ndarray:
+    """Subtracts the background of a profile and scales it to the [0, 1] range"""
+    profile_min = profile.min()
+    # The subtraction makes the only copy. Float profiles are then scaled in place
+    profile = profile - profile_min
+    if np.issubdtype(profile.dtype, np.floating):
+        profile /= profile.max()
+        return profile
+    return profile / profile.max()
+
+
 def _process_bead(bead: np.ndarray, voxel_size_micron: tuple[float, float, float]):
     if not isinstance(bead, np.ndarray) and np.isnan(bead):
         return {
@@ -258,30 +283,25 @@ def _process_bead(bead: np.ndarray, voxel_size_micron: tuple[float, float, float
             "intensity_min": np.nan,
             "intensity_std": np.nan,
         }
-    # TODO: This can be shortened
-    # Find the strongest sections to generate profiles
+    # Find the strongest sections to generate profiles. The lateral maxima are reduced from the
+    # axial MIP so that the bead is only traversed twice
     z_max = np.max(bead, axis=(1, 2))
     z_focus = np.argmax(z_max)
-    y_max = np.max(bead, axis=(0, 2))
+    bead_mip = np.max(bead, axis=0)
+    y_max = np.max(bead_mip, axis=1)
     y_focus = np.argmax(y_max)
-    x_max = np.max(bead, axis=(0, 1))
+    x_max = np.max(bead_mip, axis=0)
     x_focus = np.argmax(x_max)
 
     # Generate profiles
-    profile_z_raw = np.squeeze(bead[:, y_focus, x_focus])
-    profile_y_raw = np.squeeze(bead[z_focus, :, x_focus])
-    profile_x_raw = np.squeeze(bead[z_focus, y_focus, :])
+    profile_z_raw = bead[:, y_focus, x_focus]
+    profile_y_raw = bead[z_focus, :, x_focus]
+    profile_x_raw = bead[z_focus, y_focus, :]
 
     # Normalize the profiles and subtract the background
-    profile_z_raw = (profile_z_raw - profile_z_raw.min()) / (
-        profile_z_raw.max() - profile_z_raw.min()
-    )
-    profile_y_raw = (profile_y_raw - profile_y_raw.min()) / (
-        profile_y_raw.max() - profile_y_raw.min()
-    )
-    profile_x_raw = (profile_x_raw - profile_x_raw.min()) / (
-        profile_x_raw.max() - profile_x_raw.min()
-    )
+    profile_z_raw = _normalize_profile(profile_z_raw)
+    profile_y_raw = _normalize_profile(profile_y_raw)
+    profile_x_raw = _normalize_profile(profile_x_raw)
 
     # Fitting the profiles
     profile_z_fitted, r2_z, fwhm_z, (center_pos_z, _) = fit_airy(profile_z_raw)
@@ -303,7 +323,8 @@ def _process_bead(bead: np.ndarray, voxel_size_micron: tuple[float, float, float
         center_pos_z < fwhm_z * 4 or profile_z_raw.shape[0] - center_pos_z < fwhm_z * 4
     )
 
-    intensity_max = bead.max()
+    # The maximum is already known from the axial profile
+    intensity_max = z_max.max()
     intensity_min = bead.min()
     intensity_std = bead.std()
     intensity_integrated = (bead - intensity_min).sum()
@@ -333,12 +354,62 @@ def _process_bead(bead: np.ndarray, voxel_size_micron: tuple[float, float, float
     }
 
 
+def _get_peak_mask(image: np.ndarray, min_distance: int, threshold_rel: float) -> np.ndarray:
+    """
+    Returns the mask of the candidate peaks of peak_local_max: the maxima of their min_distance
+    neighbourhood above the relative threshold.
+    """
+    threshold = max(image.min(), threshold_rel * image.max())
+    if min_distance < 1:
+        return image > threshold
+
+    peak_mask = image == ndimage.maximum_filter(image, size=2 * min_distance + 1, mode="nearest")
+    # There is no peak in a trivial image
+    if np.all(peak_mask):
+        return np.zeros_like(peak_mask)
+
+    return peak_mask & (image > threshold)
+
+
+def _get_spaced_peaks_mask(
+    image: np.ndarray, peak_mask: np.ndarray, min_distance: int
+) -> np.ndarray:
+    """
+    Returns the mask of the peaks that peak_local_max keeps with min_distance. As in skimage, the
+    peaks are visited by decreasing intensity and a peak is kept unless it is closer than
+    min_distance to a peak already kept.
+    """
+    positions = np.argwhere(peak_mask)
+    positions = positions[np.argsort(-image[peak_mask], kind="stable")]
+
+    is_kept = np.ones(len(positions), dtype=bool)
+    if len(positions):
+        neighbours = cKDTree(positions).query_ball_point(positions, r=min_distance)
+        for position_nr, position_neighbours in enumerate(neighbours):
+            if not is_kept[position_nr]:
+                continue
+            position_neighbours = np.array(position_neighbours)
+            is_too_close = (
+                np.sum((positions[position_neighbours] - positions[position_nr]) ** 2, axis=1)
+                < min_distance**2
+            ) & (position_neighbours != position_nr)
+            is_kept[position_neighbours[is_too_close]] = False
+
+    spaced_peaks_mask = np.zeros_like(peak_mask)
+    spaced_peaks_mask[tuple(positions[is_kept].T)] = True
+
+    return spaced_peaks_mask
+
+
 def _find_beads(channel: np.ndarray, sigma: tuple[float, float, float], min_distance: float):
     logger.debug("Finding beads in channel...")
 
     if all(sigma):
         logger.debug(f"Applying Gaussian filter with sigma {sigma}")
-        channel_gauss = gaussian(image=channel, sigma=sigma)
+        # Peaks are detected on relative intensities, so single precision and the original range are enough
+        channel_gauss = gaussian(
+            image=channel.astype(np.float32, copy=False), sigma=sigma, preserve_range=True
+        )
     else:
         logger.debug("No Gaussian filter applied")
         channel_gauss = channel
@@ -346,52 +417,38 @@ def _find_beads(channel: np.ndarray, sigma: tuple[float, float, float], min_dist
     # We find the beads in the MIP for performance and to avoid anisotropy issues in the axial direction
     channel_gauss_mip = np.max(channel_gauss, axis=0)
 
-    # Find bead centers
+    # Find bead centers. Peaks are returned sorted by decreasing intensity
     positions_all = peak_local_max(image=channel_gauss_mip, threshold_rel=0.2)
-    positions_all_not_proximity_not_edge = peak_local_max(
-        image=channel_gauss_mip,
-        threshold_rel=0.2,
-        min_distance=int(min_distance),
-        exclude_border=(int(1 + min_distance // 2), int(1 + min_distance // 2)),
-        p_norm=2,
-    )
-    positions_all_not_proximity = peak_local_max(
-        image=channel_gauss_mip,
-        threshold_rel=0.2,
-        min_distance=int(min_distance),
-        exclude_border=False,
-        p_norm=2,
-    )
-
-    # We convert the arrays into sets to perform easier to follow filtering logic
-    positions_all = set(map(tuple, positions_all))
-    positions_all_not_proximity_not_edge = set(map(tuple, positions_all_not_proximity_not_edge))
-    positions_all_not_proximity = set(map(tuple, positions_all_not_proximity))
 
-    # positions_proximity_edge = positions_all - positions_all_not_proximity_not_edge
-    positions_edge = positions_all_not_proximity - positions_all_not_proximity_not_edge
-    positions_proximity = positions_all - positions_all_not_proximity
+    # Beads too close to a brighter one or to the edge are the ones peak_local_max drops with
+    # min_distance and exclude_border. Both cases share the same candidate peaks, and the border is
+    # excluded before spacing them.
+    peak_mask = _get_peak_mask(channel_gauss_mip, min_distance=int(min_distance), threshold_rel=0.2)
+    border_width = int(1 + min_distance // 2)
+    peak_mask_not_edge = np.zeros_like(peak_mask)
+    peak_mask_not_edge[border_width:-border_width, border_width:-border_width] = peak_mask[
+        border_width:-border_width, border_width:-border_width
+    ]
+    positions_all_index = tuple(positions_all.T)
+    is_not_proximity = _get_spaced_peaks_mask(channel_gauss_mip, peak_mask, int(min_distance))[
+        positions_all_index
+    ]
+    is_not_proximity_not_edge = _get_spaced_peaks_mask(
+        channel_gauss_mip, peak_mask_not_edge, int(min_distance)
+    )[positions_all_index]
 
     positions_df = pd.DataFrame(
         positions_all,
         columns=["center_y", "center_x"],
         index=pd.Index(range(len(positions_all)), name="bead_id"),
     )
-    positions_df["center_z"] = positions_df.apply(
-        lambda row: int(channel_gauss[:, row["center_y"], row["center_x"]].argmax()),
-        axis=1,
+    positions_df["center_z"] = channel_gauss[:, positions_all[:, 0], positions_all[:, 1]].argmax(
+        axis=0
     )
 
-    positions_df["considered_valid"] = positions_df.apply(
-        lambda row: (row["center_y"], row["center_x"]) in positions_all_not_proximity_not_edge,
-        axis=1,
-    )
-    positions_df["considered_self_proximity"] = positions_df.apply(
-        lambda row: (row["center_y"], row["center_x"]) in positions_proximity, axis=1
-    )
-    positions_df["considered_lateral_edge"] = positions_df.apply(
-        lambda row: (row["center_y"], row["center_x"]) in positions_edge, axis=1
-    )
+    positions_df["considered_valid"] = is_not_proximity_not_edge
+    positions_df["considered_self_proximity"] = ~is_not_proximity
+    positions_df["considered_lateral_edge"] = is_not_proximity & ~is_not_proximity_not_edge
 
     logger.debug(f"Beads found: {len(positions_all)}")
     logger.debug(f"Beads kept for further analysis: {positions_df['considered_valid'].sum()}")
@@ -402,18 +459,21 @@ def _find_beads(channel: np.ndarray, sigma: tuple[float, float, float], min_dist
         f"Beads considered for being to close to each other: {positions_df['considered_self_proximity'].sum()}"
     )
 
-    def get_bead_image(row, channel, min_distance):
-        return channel[
-            :,
-            max(0, (row["center_y"] - int(min_distance // 2))) : min(
-                channel.shape[1], (row["center_y"] + int(min_distance // 2) + 1)
-            ),
-            max(0, (row["center_x"] - int(min_distance // 2))) : min(
-                channel.shape[2], (row["center_x"] + int(min_distance // 2) + 1)
-            ),
-        ]
-
-    positions_df["beads"] = positions_df.apply(get_bead_image, axis=1, args=(channel, min_distance))
+    # The beads are views on the channel, so slice bounds are computed for all the beads at once and
+    # no voxel data is copied
+    half_distance = int(min_distance // 2)
+    lower_bounds = np.maximum(positions_all - half_distance, 0)
+    upper_bounds = np.minimum(positions_all + half_distance + 1, channel.shape[1:])
+    positions_df["beads"] = pd.Series(
+        [
+            channel[:, y_start:y_stop, x_start:x_stop]
+            for (y_start, x_start), (y_stop, x_stop) in zip(
+                lower_bounds.tolist(), upper_bounds.tolist()
+            )
+        ],
+        index=positions_df.index,
+        dtype=object,
+    )
 
     return positions_df
 
@@ -437,8 +497,9 @@ def _process_channel(
         considered_intensity_outlier=pd.Series(dtype=bool),
     )
 
+    beads_properties = [_process_bead(bead, voxel_size_micron) for bead in bead_properties["beads"]]
     bead_properties = bead_properties.join(
-        bead_properties["beads"].apply(lambda x: pd.Series(_process_bead(x, voxel_size_micron)))
+        pd.DataFrame(beads_properties, index=bead_properties.index)
     )
     bead_properties["considered_bad_fit_z"] = bead_properties["fit_r2_z"] < fitting_r2_threshold
     bead_properties["considered_bad_fit_y"] = bead_properties["fit_r2_y"] < fitting_r2_threshold
@@ -449,18 +510,19 @@ def _process_channel(
     )
 
     # We need to invalidate all the bad fits and outliers
-    bead_properties["considered_valid"] = bead_properties.apply(
-        lambda row: not any(
+    bead_properties["considered_valid"] = (
+        ~bead_properties[
             [
-                row["considered_lateral_edge"],
-                row["considered_axial_edge"],
-                row["considered_bad_fit_z"],
-                row["considered_bad_fit_y"],
-                row["considered_bad_fit_x"],
-                row["considered_intensity_outlier"],
+                "considered_lateral_edge",
+                "considered_axial_edge",
+                "considered_bad_fit_z",
+                "considered_bad_fit_y",
+                "considered_bad_fit_x",
+                "considered_intensity_outlier",
             ]
-        ),
-        axis=1,
+        ]
+        .to_numpy(dtype=bool)
+        .any(axis=1)
     )
 
     return bead_properties
@@ -484,8 +546,10 @@ def _process_image(
     # Get image data and remove the time dimension
     image = image.array_data[0, ...]
 
-    # Some images (e.g. OMX-3D-SIM) may contain negative values.
-    image = np.clip(image, a_min=0, a_max=None)
+    # Some images (e.g. OMX-3D-SIM) may contain negative values. Unsigned data can be used as is,
+    # without copying the whole array.
+    if not np.issubdtype(image.dtype, np.unsignedinteger) and image.min() < 0:
+        image = np.clip(image, a_min=0, a_max=None)
 
     nr_channels = image.shape[-1]
 
@@ -522,26 +586,36 @@ def _generate_center_roi(
     stroke_width=1,
 ):
     rois = []
+    if positions.empty:
+        return rois
+
+    # Level positions once the image_id level is dropped by xs
+    bead_id_level = positions.index.names[1:].index("bead_id")
+    channel_nr_level = positions.index.names[1:].index("channel_nr")
+    image_ids = set(positions.index.get_level_values("image_id"))
 
     for image in dataset.input_data.psf_beads_images:
         image_id = get_object_id(image) or image.name
-        if positions.empty or image_id not in positions.index.get_level_values("image_id"):
+        if image_id not in image_ids:
             continue
-        points = []
-        for index, row in positions.xs(image_id, level="image_id").iterrows():
-            points.append(
-                mm_schema.Point(
-                    name=index[positions.index.names[1:].index("bead_id")],
-                    z=row["center_z"],
-                    y=row["center_y"] + 0.5,  # Rois are centered on the voxel
-                    x=row["center_x"] + 0.5,
-                    c=index[positions.index.names[1:].index("channel_nr")],
-                    stroke_color=mm_schema.Color(
-                        r=color[0], g=color[1], b=color[2], alpha=color[3]
-                    ),
-                    stroke_width=stroke_width,
-                )
+        image_positions = positions.xs(image_id, level="image_id")
+        points = [
+            mm_schema.Point(
+                name=index[bead_id_level],
+                z=center_z,
+                y=center_y + 0.5,  # Rois are centered on the voxel
+                x=center_x + 0.5,
+                c=index[channel_nr_level],
+                stroke_color=mm_schema.Color(r=color[0], g=color[1], b=color[2], alpha=color[3]),
+                stroke_width=stroke_width,
             )
+            for index, center_z, center_y, center_x in zip(
+                image_positions.index,
+                image_positions["center_z"],
+                image_positions["center_y"],
+                image_positions["center_x"],
+            )
+        ]
 
         if points:
             rois.append(
@@ -556,27 +630,31 @@ def _generate_center_roi(
     return rois
 
 
-def _extract_profiles(bead_properties, axis: str) -> pd.DataFrame:
-    profile_col_names = [
-        f"{axis}_raw",
-        f"{axis}_fitted",
-    ]
+def _extract_profiles(bead_properties, axes: str = "zyx") -> tuple[pd.DataFrame, ...]:
+    """Extracts one profiles table per axis, walking the beads only once for all the axes"""
+    profile_col_axes = [axis for axis in axes for _ in ("raw", "fitted")]
+    profile_col_names = [f"{axis}_{profile}" for axis in axes for profile in ("raw", "fitted")]
     column_indexes = [i for i in bead_properties.index.names if i != "channel_name"]
 
-    profiles = {}
-    for index, row in bead_properties.iterrows():
-        if isinstance(index, (list, tuple)):
-            index = [index[bead_properties.index.names.index(col_i)] for col_i in column_indexes]
+    # The column names prefixes are built once per bead, the profiles are read from the columns
+    if isinstance(bead_properties.index, pd.MultiIndex):
+        level_positions = [bead_properties.index.names.index(col_i) for col_i in column_indexes]
+        index_strs = [
+            "_".join([str(index[i]) for i in level_positions]) for index in bead_properties.index
+        ]
+    else:
+        index_strs = [str(index) for index in bead_properties.index]
 
-            index_str = "_".join([str(i) for i in index])
-        else:
-            index_str = str(index)
-        for profile_name in profile_col_names:
-            profiles[f"{index_str}_{profile_name}"] = pd.Series(row[profile_name])
+    profiles = {axis: {} for axis in axes}
+    for index_str, bead_profiles in zip(
+        index_strs, bead_properties[profile_col_names].itertuples(index=False)
+    ):
+        for axis, profile_name, profile in zip(profile_col_axes, profile_col_names, bead_profiles):
+            profiles[axis][f"{index_str}_{profile_name}"] = pd.Series(profile)
 
     bead_properties.drop(columns=profile_col_names, inplace=True)
 
-    return pd.DataFrame(profiles)
+    return tuple(pd.DataFrame(profiles[axis]) for axis in axes)
 
 
 def analyse_psf_beads(dataset: mm_schema.PSFBeadsDataset) -> bool:
@@ -584,7 +662,6 @@ def analyse_psf_beads(dataset: mm_schema.PSFBeadsDataset) -> bool:
     # TODO: Implement Nyquist validation??
 
     # Containers for input data and input parameters
-    images = {}
     voxel_sizes_micron = {}
     min_bead_distance = _estimate_min_bead_distance(dataset)
     snr_threshold = dataset.input_parameters.snr_threshold
@@ -597,9 +674,6 @@ def analyse_psf_beads(dataset: mm_schema.PSFBeadsDataset) -> bool:
     # First loop to prepare data
     for image in dataset.input_data.psf_beads_images:
         image_id = get_object_id(image) or image.name
-        images[image_id] = image.array_data[0, ...]
-
-        saturated_channels[image_id] = []
 
         # Check image shape
         logger.info(f"Checking image {image_id} shape...")
@@ -613,14 +687,13 @@ def analyse_psf_beads(dataset: mm_schema.PSFBeadsDataset) -> bool:
 
         # Check image saturation
         logger.info(f"Checking image {image_id} saturation...")
-        for c in range(image.array_data.shape[-1]):
-            if is_saturated(
-                channel=image.array_data[..., c],
-                threshold=dataset.input_parameters.saturation_threshold,
-                detector_bit_depth=dataset.input_parameters.bit_depth,
-            ):
-                logger.error(f"Image {image_id}: channel {c} is saturated")
-                saturated_channels[image_id].append(c)
+        saturated_channels[image_id] = get_saturated_channels(
+            image=image.array_data,
+            threshold=dataset.input_parameters.saturation_threshold,
+            detector_bit_depth=dataset.input_parameters.bit_depth,
+        )
+        for c in saturated_channels[image_id]:
+            logger.error(f"Image {image_id}: channel {c} is saturated")
 
     if any(len(saturated_channels[name]) for name in saturated_channels):
         logger.error(f"Channels {saturated_channels} are saturated")
@@ -681,13 +754,16 @@ def analyse_psf_beads(dataset: mm_schema.PSFBeadsDataset) -> bool:
         logger.error("Voxel sizes are not equal among images. Skipping average bead calculation.")
         average_beads_properties = None
 
-    bead_profiles_z = _extract_profiles(bead_properties, "z")
-    bead_profiles_y = _extract_profiles(bead_properties, "y")
-    bead_profiles_x = _extract_profiles(bead_properties, "x")
+    bead_profiles_z, bead_profiles_y, bead_profiles_x = _extract_profiles(bead_properties)
+    (
+        average_bead_profiles_z,
+        average_bead_profiles_y,
+        average_bead_profiles_x,
+    ) = _extract_profiles(average_beads_properties)
 
-    bead_profiles_z = bead_profiles_z.join(_extract_profiles(average_beads_properties, "z"))
-    bead_profiles_y = bead_profiles_y.join(_extract_profiles(average_beads_properties, "y"))
-    bead_profiles_x = bead_profiles_x.join(_extract_profiles(average_beads_properties, "x"))
+    bead_profiles_z = bead_profiles_z.join(average_bead_profiles_z)
+    bead_profiles_y = bead_profiles_y.join(average_bead_profiles_y)
+    bead_profiles_x = bead_profiles_x.join(average_bead_profiles_x)
 
     # TODO: get more metadata from the source images
     if any(isinstance(c, np.ndarray) for c in average_beads_properties["average_bead"]):
@@ -25,12 +25,16 @@ FLOAT_DETECTOR_BIT_DEPTHS = [32, 64]
 def airy_fun(
     x: np.ndarray, centre: np.float64, amp: np.float64
 ) -> np.ndarray:  # , exp):  # , amp, bg):
-    with np.errstate(divide="ignore", invalid="ignore"):
-        return np.where(
-            (x - centre) == 0,
-            amp * 0.5**2,
-            amp * (special.j1(x - centre) / (x - centre)) ** 2,
-        )
+    # The function is evaluated many times by the fits, so we divide only where it is defined
+    # and fill in the limit at the centre, instead of masking the invalid values afterwards
+    distance = np.subtract(x, centre)
+    j1_ratio = np.divide(
+        special.j1(distance),
+        distance,
+        out=np.full_like(distance, 0.5, dtype=np.float64),
+        where=distance != 0,
+    )
+    return amp * j1_ratio**2
 
 
 def gaussian_fun(x, background, amplitude, center, sd):
@@ -76,8 +80,10 @@ def fit_airy(profile, guess=None):
     fitted_profile = airy_fun(x, popt[0], popt[1])
 
     # Calculate the FWHM
+    half_max = (fitted_profile.max() - fitted_profile.min()) / 2
+
     def _f(d):
-        return airy_fun(d, popt[0], popt[1]) - (fitted_profile.max() - fitted_profile.min()) / 2
+        return airy_fun(d, popt[0], popt[1]) - half_max
 
     guess = np.array([fitted_profile.argmax() - 1, fitted_profile.argmax() + 1])
     v = fsolve(_f, guess)
@@ -99,18 +105,10 @@ def multi_airy_fun(x: np.ndarray, *params) -> np.ndarray:
     return y
 
 
-def is_saturated(
-    channel: np.ndarray, threshold: float = 0.0, detector_bit_depth: Optional[int] = None
-) -> bool:
+def _get_saturation_limit(dtype: np.dtype, detector_bit_depth: Optional[int] = None):
     """
-    Checks if the channel is saturated.
-    A warning if it suspects that the detector bit depth does not match the datatype.
-    thresh: float
-        Threshold for the ratio of saturated pixels to total pixels
-    detector_bit_depth: int
-        Bit depth of the detector. Sometimes, detectors bit depth are not matching the datatype of the measureemnts.
-        Here it can be specified the bit depth of the detector if known. The function is going to raise
-        If None, it will be inferred from the channel dtype.
+    Returns the value at which a detector with the provided bit depth saturates for data of the provided dtype.
+    Raises a ValueError if the detector bit depth is not supported or does not match the dtype.
     """
     if detector_bit_depth is not None:
         if (
@@ -120,48 +118,66 @@ def is_saturated(
             raise ValueError(
                 f"The detector bit depth provided ({detector_bit_depth}) is not supported. Supported values are {INT_DETECTOR_BIT_DEPTHS} for integer detectors and {FLOAT_DETECTOR_BIT_DEPTHS} for floating point detectors."
             )
-        if (
-            np.issubdtype(channel.dtype, np.integer)
-            and detector_bit_depth not in INT_DETECTOR_BIT_DEPTHS
-        ):
+        if np.issubdtype(dtype, np.integer) and detector_bit_depth not in INT_DETECTOR_BIT_DEPTHS:
             raise ValueError(
-                f"The channel datatype {channel.dtype} does not match the detector bit depth {detector_bit_depth}. The channel might be saturated."
+                f"The channel datatype {dtype} does not match the detector bit depth {detector_bit_depth}. The channel might be saturated."
             )
         elif (
-            np.issubdtype(channel.dtype, np.floating)
+            np.issubdtype(dtype, np.floating)
             and detector_bit_depth not in FLOAT_DETECTOR_BIT_DEPTHS
         ):
             raise ValueError(
-                f"The channel datatype {channel.dtype} does not match the detector bit depth {detector_bit_depth}. The channel might be saturated."
+                f"The channel datatype {dtype} does not match the detector bit depth {detector_bit_depth}. The channel might be saturated."
             )
         else:
-            if np.issubdtype(channel.dtype, np.integer):
-                if detector_bit_depth > np.iinfo(channel.dtype).bits:
+            if np.issubdtype(dtype, np.integer):
+                if detector_bit_depth > np.iinfo(dtype).bits:
                     raise ValueError(
-                        f"The channel datatype {channel.dtype} does not support the detector bit depth {detector_bit_depth}. The channel might be saturated."
+                        f"The channel datatype {dtype} does not support the detector bit depth {detector_bit_depth}. The channel might be saturated."
                     )
                 else:
                     max_limit = pow(2, detector_bit_depth) - 1
-            elif np.issubdtype(channel.dtype, np.floating):
-                if detector_bit_depth != np.finfo(channel.dtype).bits:
+            elif np.issubdtype(dtype, np.floating):
+                if detector_bit_depth != np.finfo(dtype).bits:
                     raise ValueError(
-                        f"The channel datatype {channel.dtype} does not support the detector bit depth {detector_bit_depth}. The channel might be saturated."
+                        f"The channel datatype {dtype} does not support the detector bit depth {detector_bit_depth}. The channel might be saturated."
                     )
                 else:
-                    max_limit = np.finfo(channel.dtype).max
-
+                    max_limit = np.finfo(dtype).max
     else:
-        if np.issubdtype(channel.dtype, np.integer):
-            max_limit = np.iinfo(channel.dtype).max
-        elif np.issubdtype(channel.dtype, np.floating):
-            max_limit = np.finfo(channel.dtype).max
+        if np.issubdtype(dtype, np.integer):
+            max_limit = np.iinfo(dtype).max
+        elif np.issubdtype(dtype, np.floating):
+            max_limit = np.finfo(dtype).max
         else:
             raise ValueError("The channel provided is not a valid numpy dtype.")
 
-    if channel.max() > max_limit:
+    return max_limit
+
+
+def is_saturated(
+    channel: np.ndarray, threshold: float = 0.0, detector_bit_depth: Optional[int] = None
+) -> bool:
+    """
+    Checks if the channel is saturated.
+    A warning if it suspects that the detector bit depth does not match the datatype.
+    thresh: float
+        Threshold for the ratio of saturated pixels to total pixels
+    detector_bit_depth: int
+        Bit depth of the detector. Sometimes, detectors bit depth are not matching the datatype of the measureemnts.
+        Here it can be specified the bit depth of the detector if known. The function is going to raise
+        If None, it will be inferred from the channel dtype.
+    """
+    max_limit = _get_saturation_limit(channel.dtype, detector_bit_depth)
+
+    channel_max = channel.max()
+    if channel_max > max_limit:
         raise ValueError(
             "The channel provided has values larger than the bit depth of the detector."
         )
+    if channel_max < max_limit:
+        # No pixel reaches the limit, there is no need to count them
+        return False
 
     saturation_matrix = channel == max_limit
     saturation_ratio = np.count_nonzero(saturation_matrix) / channel.size
@@ -169,6 +185,34 @@ def is_saturated(
     return saturation_ratio > threshold
 
 
+def get_saturated_channels(
+    image: np.ndarray, threshold: float = 0.0, detector_bit_depth: Optional[int] = None
+) -> List[int]:
+    """
+    Returns the indexes of the saturated channels of an image. All the channels are checked at once, traversing the
+    image in memory order, instead of calling is_saturated on every strided channel view.
+    image: np.ndarray
+        Image with the channels in the last dimension
+    thresh: float
+        Threshold for the ratio of saturated pixels to total pixels
+    detector_bit_depth: int
+        Bit depth of the detector. If None, it will be inferred from the image dtype.
+    """
+    max_limit = _get_saturation_limit(image.dtype, detector_bit_depth)
+
+    image_max = image.max()
+    if image_max > max_limit:
+        raise ValueError("The image provided has values larger than the bit depth of the detector.")
+    if image_max < max_limit:
+        # No pixel reaches the limit, there is no need to count them
+        return []
+
+    saturated_counts = np.count_nonzero(image == max_limit, axis=tuple(range(image.ndim - 1)))
+    saturation_ratios = saturated_counts / (image.size // image.shape[-1])
+
+    return np.flatnonzero(saturation_ratios > threshold).tolist()
+
+
 def _segment_channel(
     channel,
     min_distance,
@@ -1,5 +1,7 @@
 import dataclasses
 import random
+from collections import defaultdict
+from typing import Optional
 
 import numpy as np
 import pandas as pd
@@ -12,9 +14,9 @@ except ImportError:
         "In order to run the strategies you need to install the test extras. Run `pip install microscopemetrics[test]`."
     )
 from microscopemetrics_schema import strategies as st_mm_schema
+from scipy import ndimage
 from skimage.exposure import rescale_intensity as skimage_rescale_intensity
 from skimage.filters import gaussian as skimage_gaussian
-from skimage.util import random_noise as skimage_random_noise
 
 from microscopemetrics.analyses import (  # argolight,
     field_illumination,
@@ -23,6 +25,33 @@ from microscopemetrics.analyses import (  # argolight,
 )
 
 
+def _get_bit_depth(dtype: np.dtype):
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).bits
+    elif np.issubdtype(dtype, np.floating):
+        return np.finfo(dtype).bits
+    else:
+        return None
+
+
+def poisson_noise(image: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    # Same scaling as skimage's random_noise(mode="poisson") on non-negative images. Without a
+    # generator, the noise is drawn from numpy's global random state as the rest of the generated
+    # data, so examples can be replayed
+    vals = 2 ** np.ceil(np.log2(len(np.unique(image))))
+    poisson = np.random.poisson if rng is None else rng.poisson
+    return poisson(image * vals) / vals
+
+
+def _rescale_to_dtype(image: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    # Same as skimage's rescale_intensity(image, in_range=(0.0, 1.0), out_range=dtype) on the float
+    # images generated here, but clipping and scaling in place before a single cast
+    np.clip(image, 0.0, 1.0, out=image)
+    if np.issubdtype(dtype, np.integer):
+        image *= np.iinfo(dtype).max
+    return image.astype(dtype)
+
+
 # Strategies for Field Illumination
 def _gen_field_illumination_channel(
     y_shape: int,
@@ -60,7 +89,7 @@ def _gen_field_illumination_channel(
         # The noise on a 1.0 intensity image is too strong, so we rescale the image to
         # the defined signal and then rescale it back to the target intensity
         channel = channel * signal
-        channel = skimage_random_noise(channel, mode="poisson", clip=False)
+        channel = poisson_noise(channel)
         channel = channel / signal
 
     return channel
@@ -96,8 +125,7 @@ def _gen_field_illumination_image(
         )
 
     # Rescale to the target dtype
-    image = np.clip(image, None, 1)
-    image = skimage_rescale_intensity(image, in_range=(0.0, 1.0), out_range=dtype)
+    image = _rescale_to_dtype(image, dtype)
     image = np.expand_dims(image, (0, 1))
 
     return image
@@ -221,17 +249,9 @@ def st_field_illumination_dataset(
     }
     if len(image_dtype) != 1:
         raise ValueError("All images should have the same data type")
-    image_dtype = image_dtype.pop()
-    if np.issubdtype(image_dtype, np.integer):
-        field_illumination_unprocessed_dataset.input_parameters.bit_depth = np.iinfo(
-            image_dtype
-        ).bits
-    elif np.issubdtype(image_dtype, np.floating):
-        field_illumination_unprocessed_dataset.input_parameters.bit_depth = np.finfo(
-            image_dtype
-        ).bits
-    else:
-        field_illumination_unprocessed_dataset.input_parameters.bit_depth = None
+    field_illumination_unprocessed_dataset.input_parameters.bit_depth = _get_bit_depth(
+        image_dtype.pop()
+    )
 
     return {
         "unprocessed_dataset": field_illumination_unprocessed_dataset,
@@ -276,6 +296,27 @@ def _gen_psf_beads_channel():
     pass
 
 
+def _add_if_isolated(
+    positions: list,
+    grid: defaultdict,
+    pos: tuple[int, int, int],
+    min_distance_y: int,
+    min_distance_x: int,
+):
+    # Positions are hashed into cells of min_distance, so only the neighbouring cells need checking
+    cell_y, cell_x = pos[1] // min_distance_y, pos[2] // min_distance_x
+    for neighbour_y in (cell_y - 1, cell_y, cell_y + 1):
+        for neighbour_x in (cell_x - 1, cell_x, cell_x + 1):
+            for other_pos in grid.get((neighbour_y, neighbour_x), ()):
+                if (
+                    abs(other_pos[1] - pos[1]) <= min_distance_y
+                    and abs(other_pos[2] - pos[2]) <= min_distance_x
+                ):
+                    return
+    positions.append(pos)
+    grid[(cell_y, cell_x)].append(pos)
+
+
 def _gen_psf_beads_image(
     z_image_shape: int,
     y_image_shape: int,
@@ -297,11 +338,13 @@ def _gen_psf_beads_image(
     signal: int,
     dtype: np.dtype,
 ):
-    # Generate the image as float64
-    image = np.zeros(
-        shape=(z_image_shape, y_image_shape, x_image_shape, c_image_shape),
+    # Generate the image as float32. The channels are laid out contiguously so that they can be
+    # filtered in place, image being the ZYXC view on them
+    image_channels = np.zeros(
+        shape=(c_image_shape, z_image_shape, y_image_shape, x_image_shape),
         dtype="float32",
     )
+    image = np.moveaxis(image_channels, 0, -1)
 
     applied_sigmas = []
     non_edge_bead_positions = []
@@ -310,6 +353,9 @@ def _gen_psf_beads_image(
     out_of_focus_bead_positions = []
     clustering_bead_positions = []
 
+    non_edge_grid = defaultdict(list)
+    edge_grid = defaultdict(list)
+
     # The strategy is as follows:
     # 1. Generate the valid beads in the center of the image.
     # Those equal to valid_beads + out_of_focus_beads + clustering_beads
@@ -321,15 +367,13 @@ def _gen_psf_beads_image(
         z_pos = z_image_shape // 2
         y_pos = random.randint(min_distance_y + 2, y_image_shape - min_distance_y - 2)
         x_pos = random.randint(min_distance_x + 2, x_image_shape - min_distance_x - 2)
-        if not non_edge_bead_positions:
-            non_edge_bead_positions.append((z_pos, y_pos, x_pos))
-        for pos in non_edge_bead_positions:
-            if abs(pos[1] - y_pos) <= min_distance_y and abs(pos[2] - x_pos) <= min_distance_x:
-                break
-            else:
-                continue
-        else:
-            non_edge_bead_positions.append((z_pos, y_pos, x_pos))
+        _add_if_isolated(
+            non_edge_bead_positions,
+            non_edge_grid,
+            (z_pos, y_pos, x_pos),
+            min_distance_y,
+            min_distance_x,
+        )
 
     while len(edge_bead_positions) < nr_edge_beads:
         z_pos = z_image_shape // 2
@@ -345,15 +389,13 @@ def _gen_psf_beads_image(
                 random.randint(x_image_shape - min_distance_x // 2 + 2, x_image_shape - 5),
             ]
         )
-        if not edge_bead_positions:
-            edge_bead_positions.append((z_pos, y_pos, x_pos))
-        for pos in edge_bead_positions:
-            if abs(pos[1] - y_pos) <= min_distance_y and abs(pos[2] - x_pos) <= min_distance_x:
-                break
-            else:
-                continue
-        else:
-            edge_bead_positions.append((z_pos, y_pos, x_pos))
+        _add_if_isolated(
+            edge_bead_positions,
+            edge_grid,
+            (z_pos, y_pos, x_pos),
+            min_distance_y,
+            min_distance_x,
+        )
 
     for _ in range(nr_out_of_focus_beads):
         pos = non_edge_bead_positions.pop()
@@ -382,13 +424,17 @@ def _gen_psf_beads_image(
             (pos_1[0], (pos_1[1] + pos_2[1]) // 2, (pos_1[2] + pos_2[2]) // 2)
         )
 
-    for pos in edge_bead_positions:
-        image[pos[0], pos[1], pos[2], :] = np.random.normal(signal, signal / 50)
-    for pos in non_edge_bead_positions:
-        image[pos[0], pos[1], pos[2], :] = np.random.normal(signal, signal / 50)
-        valid_bead_positions.append(pos)
-    for pos in out_of_focus_bead_positions:
-        image[pos[0], pos[1], pos[2], :] = np.random.normal(signal, signal / 50)
+    valid_bead_positions.extend(non_edge_bead_positions)
+
+    # The single beads are placed at once, drawing their intensities in the same order as before
+    single_bead_positions = (
+        edge_bead_positions + non_edge_bead_positions + out_of_focus_bead_positions
+    )
+    if single_bead_positions:
+        z_positions, y_positions, x_positions = np.array(single_bead_positions).T
+        image[z_positions, y_positions, x_positions, :] = np.random.normal(
+            signal, signal / 50, size=(len(single_bead_positions), 1)
+        )
 
     # Apply a gaussian filter to the image
     for ch in range(c_image_shape):
@@ -400,13 +446,14 @@ def _gen_psf_beads_image(
                 sigma_x * sigma_correction,
             )
         )
-        image[:, :, :, ch] = skimage_gaussian(
-            image[:, :, :, ch], sigma=applied_sigmas[-1], preserve_range=True
+        ndimage.gaussian_filter(
+            image_channels[ch], sigma=applied_sigmas[-1], mode="nearest", output=image_channels[ch]
         )
+    image = np.ascontiguousarray(image)
 
     # Add noise
     if do_noise:
-        image = skimage_random_noise(image, mode="poisson", clip=False)
+        image = poisson_noise(image)
 
     image = skimage_rescale_intensity(
         image,
@@ -414,7 +461,7 @@ def _gen_psf_beads_image(
         out_range=(target_min_intensity, target_max_intensity),
     )
 
-    image = skimage_rescale_intensity(image, in_range=(0.0, 1.0), out_range=dtype)
+    image = _rescale_to_dtype(image, dtype)
 
     image = np.expand_dims(image, 0)
 
@@ -571,13 +618,7 @@ def st_psf_beads_dataset(
     }
     if len(image_dtype) != 1:
         raise ValueError("All images should have the same data type")
-    image_dtype = image_dtype.pop()
-    if np.issubdtype(image_dtype, np.integer):
-        psf_beads_unprocessed_dataset.input_parameters.bit_depth = np.iinfo(image_dtype).bits
-    elif np.issubdtype(image_dtype, np.floating):
-        psf_beads_unprocessed_dataset.input_parameters.bit_depth = np.finfo(image_dtype).bits
-    else:
-        psf_beads_unprocessed_dataset.input_parameters.bit_depth = None
+    psf_beads_unprocessed_dataset.input_parameters.bit_depth = _get_bit_depth(image_dtype.pop())
 
     return {
         "unprocessed_dataset": psf_beads_unprocessed_dataset,
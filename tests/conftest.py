@@ -1,5 +1,6 @@
 # run pytest with --hypothesis-profile=dev to load a profile
 
+import pytest
 from hypothesis import HealthCheck, Verbosity, settings
 
 settings.register_profile(
@@ -56,3 +57,16 @@ settings.register_profile(
     verbosity=Verbosity.verbose,
     print_blob=True,
 )
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="run slow tests")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -1,18 +1,21 @@
 import numpy as np
 import pandas as pd
 import pytest
-from hypothesis import given, reproduce_failure, settings
+from hypothesis import Phase, given, reproduce_failure, settings
 from hypothesis import strategies as st
 from microscopemetrics_schema import datamodel as mm_schema
 from microscopemetrics_schema import strategies as st_mm_schema
 from scipy import ndimage
+from skimage.feature import peak_local_max
 from skimage.filters import gaussian
-from skimage.util import random_noise as skimage_random_noise
 
 from microscopemetrics.analyses import psf_beads
 from microscopemetrics.strategies import strategies as st_mm
 from microscopemetrics.analyses.tools import fit_gaussian
 
+# Shrinking reruns the full analysis on large images, so the slow tests skip it
+NO_SHRINK_PHASES = [Phase.explicit, Phase.reuse, Phase.generate, Phase.target]
+
 
 @given(
     shifts=st.lists(
@@ -27,11 +30,20 @@ from microscopemetrics.analyses.tools import fit_gaussian
     signal=st.integers(min_value=50, max_value=1000),
     sigma_axial=st.floats(min_value=1.0, max_value=3.0),
     sigma_lateral=st.floats(min_value=1.0, max_value=2.0),
+    seed=st.integers(min_value=0, max_value=2**32 - 1),
 )
-def test_average_beads(shifts, signal, sigma_axial, sigma_lateral):
+def test_average_beads(shifts, signal, sigma_axial, sigma_lateral, seed):
+    rng = np.random.default_rng(seed)
     beads = []
     ref_beads = []
 
+    # The reference replica is never shifted, so it is blurred once and then noised for each bead
+    blurred_ref_bead = np.zeros((61, 21, 21), dtype=np.int16)
+    blurred_ref_bead[30, 10, 10] = signal
+    blurred_ref_bead = gaussian(
+        blurred_ref_bead, sigma=(sigma_axial, sigma_lateral, sigma_lateral), preserve_range=True
+    )
+
     for shift in shifts:
         # Reproducing acquisition flow:
         # - bead real position shifted
@@ -40,16 +52,12 @@ def test_average_beads(shifts, signal, sigma_axial, sigma_lateral):
         # a replica is caught as reference before shifting
         bead = np.zeros((61, 21, 21), dtype=np.int16)
         bead[30, 10, 10] = signal
-        ref_bead = bead.copy()
         bead = ndimage.shift(bead, shift, mode="nearest", order=1)
         bead = gaussian(
             bead, sigma=(sigma_axial, sigma_lateral, sigma_lateral), preserve_range=True
         )
-        ref_bead = gaussian(
-            ref_bead, sigma=(sigma_axial, sigma_lateral, sigma_lateral), preserve_range=True
-        )
-        bead = skimage_random_noise(bead, mode="poisson", clip=False)
-        ref_bead = skimage_random_noise(ref_bead, mode="poisson", clip=False)
+        bead = st_mm.poisson_noise(bead, rng=rng)
+        ref_bead = st_mm.poisson_noise(blurred_ref_bead, rng=rng)
         beads.append(bead)
         ref_beads.append(ref_bead)
 
@@ -71,6 +79,116 @@ def test_average_beads(shifts, signal, sigma_axial, sigma_lateral):
     assert averaged_sigma_x == pytest.approx(ref_sigma_x, abs=0.3)
 
 
+@given(
+    seed=st.integers(min_value=0, max_value=2**32 - 1),
+    min_distance=st.integers(min_value=0, max_value=7),
+    nr_intensity_levels=st.integers(min_value=2, max_value=5),
+)
+def test_find_beads_matches_peak_local_max(seed, min_distance, nr_intensity_levels):
+    # A few intensity levels on a small unfiltered image give plenty of plateaus and close peaks
+    rng = np.random.default_rng(seed)
+    channel = rng.integers(0, nr_intensity_levels, size=(3, 24, 32)).astype(np.uint16) * 10
+
+    bead_properties = psf_beads._find_beads(
+        channel=channel, sigma=(0, 0, 0), min_distance=min_distance
+    )
+
+    channel_mip = channel.max(axis=0)
+    positions_all = set(map(tuple, peak_local_max(channel_mip, threshold_rel=0.2)))
+    positions_not_proximity_not_edge = set(
+        map(
+            tuple,
+            peak_local_max(
+                channel_mip,
+                threshold_rel=0.2,
+                min_distance=min_distance,
+                exclude_border=(1 + min_distance // 2, 1 + min_distance // 2),
+                p_norm=2,
+            ),
+        )
+    )
+    positions_not_proximity = set(
+        map(
+            tuple,
+            peak_local_max(
+                channel_mip,
+                threshold_rel=0.2,
+                min_distance=min_distance,
+                exclude_border=False,
+                p_norm=2,
+            ),
+        )
+    )
+
+    positions = list(zip(bead_properties.center_y, bead_properties.center_x))
+    assert set(positions) == positions_all
+    assert bead_properties.considered_valid.tolist() == [
+        position in positions_not_proximity_not_edge for position in positions
+    ]
+    assert bead_properties.considered_self_proximity.tolist() == [
+        position not in positions_not_proximity for position in positions
+    ]
+    assert bead_properties.considered_lateral_edge.tolist() == [
+        position in positions_not_proximity - positions_not_proximity_not_edge
+        for position in positions
+    ]
+
+
+@given(
+    shift=st.tuples(
+        st.floats(min_value=-2.0, max_value=2.0),
+        st.floats(min_value=-2.0, max_value=2.0),
+        st.floats(min_value=-2.0, max_value=2.0),
+    )
+)
+def test_find_bead_shifts(shift):
+    bead = np.zeros((21, 15, 15))
+    bead[10, 7, 7] = 1000
+    bead = ndimage.gaussian_filter(ndimage.shift(bead, shift, order=1), sigma=(2, 1.5, 1.5))
+
+    assert psf_beads._find_bead_shifts(bead) == pytest.approx(shift, abs=0.05)
+    assert psf_beads._find_bead_shifts(bead, bead) == pytest.approx((0, 0, 0), abs=0.05)
+
+
+def test_process_channel():
+    isolated_positions = [(16, 16), (16, 46), (44, 30)]
+    edge_position = (2, 40)
+    close_positions = [(50, 10), (53, 12)]
+    channel = np.zeros((31, 64, 64))
+    for y, x in isolated_positions + [edge_position] + close_positions:
+        channel[15, y, x] = 1
+    channel = ndimage.gaussian_filter(channel, sigma=(2, 1.5, 1.5))
+    channel = (channel / channel.max() * 1000 + 10).astype(np.uint16)
+
+    bead_properties = psf_beads._process_channel(
+        channel=channel,
+        sigma=(1, 1, 1),
+        min_bead_distance=10,
+        snr_threshold=10,
+        fitting_r2_threshold=0.8,
+        intensity_robust_z_score_threshold=3.0,
+        voxel_size_micron=(0.2, 0.05, 0.05),
+    )
+    bead_properties = bead_properties.set_index(["center_y", "center_x"])
+
+    assert len(bead_properties) == 6
+    assert (bead_properties.center_z == 15).all()
+    assert bead_properties.considered_self_proximity.sum() == 1
+
+    isolated_beads = bead_properties.loc[isolated_positions]
+    assert isolated_beads.considered_valid.all()
+    assert (isolated_beads[["fit_r2_z", "fit_r2_y", "fit_r2_x"]] > 0.8).all(axis=None)
+    # The isolated beads are identical, so they are measured identically
+    for column in ["fwhm_pixel_z", "fwhm_pixel_y", "fwhm_pixel_x"]:
+        assert isolated_beads[column].to_numpy() == pytest.approx(isolated_beads[column].iloc[0])
+    assert isolated_beads.fwhm_micron_y.to_numpy() == pytest.approx(
+        isolated_beads.fwhm_pixel_y.to_numpy() * 0.05
+    )
+
+    assert bead_properties.loc[edge_position].considered_lateral_edge
+    assert not bead_properties.loc[edge_position].considered_valid
+
+
 @given(st_mm.st_psf_beads_dataset())
 @settings(max_examples=1)
 def test_psf_beads_analysis_instantiation(dataset):
@@ -91,6 +209,7 @@ def test_psf_beads_analysis_run(dataset):
     assert dataset.processed
 
 
+@pytest.mark.slow
 @given(
     st_mm.st_psf_beads_dataset(
         test_data=st_mm.st_psf_beads_test_data(
@@ -114,6 +233,7 @@ def test_psf_beads_analysis_run(dataset):
         ),
     )
 )
+@settings(phases=NO_SHRINK_PHASES)
 def test_psf_beads_analysis_nr_valid_beads(dataset):
     psf_beads_dataset = dataset["unprocessed_dataset"]
     expected_output = dataset["expected_output"]
@@ -129,6 +249,7 @@ def test_psf_beads_analysis_nr_valid_beads(dataset):
         assert measured == expected
 
 
+@pytest.mark.slow
 @given(
     st_mm.st_psf_beads_dataset(
         test_data=st_mm.st_psf_beads_test_data(
@@ -143,6 +264,7 @@ def test_psf_beads_analysis_nr_valid_beads(dataset):
         )
     )
 )
+@settings(phases=NO_SHRINK_PHASES)
 def test_psf_beads_analysis_nr_lateral_edge_beads(dataset):
     psf_beads_dataset = dataset["unprocessed_dataset"]
     expected_output = dataset["expected_output"]
@@ -157,6 +279,7 @@ def test_psf_beads_analysis_nr_lateral_edge_beads(dataset):
         assert measured == expected
 
 
+@pytest.mark.slow
 @given(
     st_mm.st_psf_beads_dataset(
         test_data=st_mm.st_psf_beads_test_data(
@@ -171,6 +294,7 @@ def test_psf_beads_analysis_nr_lateral_edge_beads(dataset):
         )
     )
 )
+@settings(phases=NO_SHRINK_PHASES)
 def test_psf_beads_analysis_nr_axial_edge_beads(dataset):
     psf_beads_dataset = dataset["unprocessed_dataset"]
     expected_output = dataset["expected_output"]
@@ -182,6 +306,7 @@ def test_psf_beads_analysis_nr_axial_edge_beads(dataset):
         assert measured == expected
 
 
+@pytest.mark.slow
 @given(
     st_mm.st_psf_beads_dataset(
         test_data=st_mm.st_psf_beads_test_data(
@@ -205,7 +330,7 @@ def test_psf_beads_analysis_nr_axial_edge_beads(dataset):
         )
     )
 )
-@settings(deadline=200000)
+@settings(deadline=200000, phases=NO_SHRINK_PHASES)
 def test_psf_beads_analysis_nr_intensity_outliers_beads(dataset):
     psf_beads_dataset = dataset["unprocessed_dataset"]
     expected_output = dataset["expected_output"]
@@ -2,7 +2,7 @@ import numpy as np
 from hypothesis import given
 from hypothesis import strategies as st
 
-from microscopemetrics.analyses.tools import is_saturated
+from microscopemetrics.analyses.tools import get_saturated_channels, is_saturated
 
 
 @given(st.sampled_from([np.uint8, np.uint16, np.float32]))
@@ -21,3 +21,21 @@ def test_is_saturated(data_type):
     assert not is_saturated(unsaturated_data, threshold=0.4)
     assert is_saturated(saturated_data)
     assert not is_saturated(saturated_data, threshold=0.6)
+
+
+@given(st.sampled_from([np.uint8, np.uint16, np.float32]))
+def test_get_saturated_channels(data_type):
+    if np.issubdtype(data_type, np.integer):
+        max_value = np.iinfo(data_type).max
+    elif np.issubdtype(data_type, np.floating):
+        max_value = np.finfo(data_type).max
+    else:
+        raise ValueError("Unsupported datatype")
+    data = np.zeros((10, 10, 3), data_type)
+    data[0:5, :, 0] = max_value / 2  # 50% of the channel is at half the max value
+    data[0:5, :, 2] = max_value  # 50% of the channel is saturated
+    assert get_saturated_channels(data) == [2]
+    assert get_saturated_channels(data, threshold=0.4) == [2]
+    assert get_saturated_channels(data, threshold=0.6) == []
+    for c in range(data.shape[-1]):
+        assert (c in get_saturated_channels(data)) == is_saturated(data[..., c])